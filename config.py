@@ -2,11 +2,24 @@
 
 import json
 import os
-from typing import List, Dict, Any, Optional
+import sys
+from typing import Dict, Any, Optional, Set, Tuple
 from dataclasses import dataclass, asdict
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
 
-@dataclass
+SERVER_TYPES = frozenset({'echo', 'web'})
+
+# dataclass(slots=True) needs Python 3.10+; older versions keep a __dict__
+_DATACLASS_OPTIONS: Dict[str, Any] = {'frozen': True}
+if sys.version_info >= (3, 10):
+    _DATACLASS_OPTIONS['slots'] = True
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class ServerConfig:
     """Configuration for a single server."""
     type: str  # 'echo' or 'web'
@@ -16,20 +29,37 @@ class ServerConfig:
 
     def validate(self) -> None:
         """Validate server configuration."""
-        if self.type not in ['echo', 'web']:
+        if self.type not in SERVER_TYPES:
             raise ValueError(f"Invalid server type: {self.type}. Must be 'echo' or 'web'")
 
-        if not isinstance(self.port, int) or self.port < 1 or self.port > 65535:
+        if not isinstance(self.port, int) or not 1 <= self.port <= 65535:
             raise ValueError(f"Invalid port: {self.port}. Must be between 1 and 65535")
 
         if self.type == 'web' and not self.content:
             raise ValueError("Web servers must have content specified")
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Config:
     """Main configuration container."""
-    servers: List[ServerConfig]
+    servers: Tuple[ServerConfig, ...]
+
+    def __post_init__(self) -> None:
+        """Store servers as a tuple so the frozen instance is fully immutable."""
+        if not isinstance(self.servers, tuple):
+            object.__setattr__(self, 'servers', tuple(self.servers))
+
+    @staticmethod
+    def invalidate_cache(filepath: Optional[str] = None) -> None:
+        """Drop cached results of :meth:`load`.
+
+        Args:
+            filepath: Only forget this file (default: forget every file)
+        """
+        if filepath is None:
+            _LOAD_CACHE.clear()
+        else:
+            _LOAD_CACHE.pop(filepath, None)
 
     def validate(self) -> None:
         """Validate entire configuration."""
@@ -40,12 +70,12 @@ class Config:
             raise ValueError("Maximum of 10 servers allowed")
 
         # Validate each server and check for port conflicts
-        ports = []
+        ports: Set[int] = set()
         for server in self.servers:
             server.validate()
             if server.port in ports:
                 raise ValueError(f"Port {server.port} is used by multiple servers")
-            ports.append(server.port)
+            ports.add(server.port)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary."""
@@ -56,28 +86,62 @@ class Config:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Config':
         """Create configuration from dictionary."""
-        servers = [ServerConfig(**s) for s in data.get('servers', [])]
+        servers = tuple(ServerConfig(**s) for s in data.get('servers', []))
         return cls(servers=servers)
 
-    def save(self, filepath: str) -> None:
-        """Save configuration to JSON file."""
-        with open(filepath, 'w') as f:
-            json.dump(self.to_dict(), f, indent=2)
+    def save(self, filepath: str, compact: bool = False) -> None:
+        """Save configuration to JSON file.
+
+        Args:
+            filepath: Destination path
+            compact: Write minified JSON instead of indented output
+        """
+        data = self.to_dict()
+        if orjson is not None:
+            option = 0 if compact else orjson.OPT_INDENT_2
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(data, option=option))
+            return
+
+        with open(filepath, 'w', encoding='utf-8') as f:
+            if compact:
+                json.dump(data, f, separators=(',', ':'))
+            else:
+                json.dump(data, f, indent=2)
 
     @classmethod
     def load(cls, filepath: str) -> 'Config':
-        """Load configuration from JSON file."""
-        if not os.path.exists(filepath):
-            raise FileNotFoundError(f"Configuration file not found: {filepath}")
-
-        with open(filepath, 'r') as f:
-            data = json.load(f)
+        """Load configuration from JSON file.
+
+        Results are cached per path and reused until the file's mtime or
+        size changes, so repeated loads of an unchanged file are cheap.
+        """
+        try:
+            st = os.stat(filepath)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file not found: {filepath}") from None
+
+        cached = _LOAD_CACHE.get(filepath)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+
+        if orjson is not None:
+            with open(filepath, 'rb') as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                data = json.load(f)
 
         config = cls.from_dict(data)
         config.validate()
+        _LOAD_CACHE[filepath] = (st.st_mtime_ns, st.st_size, config)
         return config
 
 
+# Maps a config file path to (st_mtime_ns, st_size, validated Config)
+_LOAD_CACHE: Dict[str, Tuple[int, int, Config]] = {}
+
+
 def get_default_config_path() -> str:
     """Get the default configuration file path."""
     return os.path.join(os.getcwd(), 'server_config.json')
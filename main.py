@@ -3,15 +3,17 @@
 
 import argparse
 import asyncio
+import functools
 import logging
+import os
 import signal
 import socket
 import sys
-from typing import List, Union
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Tuple, Union
 
-from config import Config, get_default_config_path
+from config import Config, ServerConfig, get_default_config_path
 from servers.echo_server import EchoServer
-from servers.web_server import WebServer
+from servers.web_server import SharedWebApp, WebServer
 
 
 # Configure logging
@@ -23,9 +25,13 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
 def get_active_ip_addresses() -> List[str]:
     """Get list of active IP addresses on this system, excluding localhost.
 
+    The result is cached for the lifetime of the process; call
+    ``get_active_ip_addresses.cache_clear()`` to force a fresh lookup.
+
     Returns:
         List of IP addresses
     """
@@ -66,6 +72,82 @@ def get_active_ip_addresses() -> List[str]:
     return ip_addresses
 
 
+def get_uvloop_factory() -> Optional[Callable[[], asyncio.AbstractEventLoop]]:
+    """Get uvloop's event loop factory if uvloop should be used.
+
+    Set SIMPLETCP_UVLOOP=0 to keep the default event loop. uvloop is not
+    available on Windows.
+
+    Returns:
+        Factory creating uvloop event loops, or None to use the default loop
+    """
+    if os.environ.get('SIMPLETCP_UVLOOP', '1') == '0':
+        return None
+
+    try:
+        import uvloop
+    except ImportError:
+        return None
+
+    return uvloop.new_event_loop
+
+
+def run_event_loop(main: Coroutine[Any, Any, None],
+                   loop_factory: Optional[Callable[[], asyncio.AbstractEventLoop]] = None) -> None:
+    """Run a coroutine to completion, optionally on a custom event loop.
+
+    Args:
+        main: Coroutine to run
+        loop_factory: Event loop factory (default: asyncio's default loop)
+    """
+    if loop_factory is None:
+        asyncio.run(main)
+    elif sys.version_info >= (3, 12):
+        asyncio.run(main, loop_factory=loop_factory)
+    else:
+        # asyncio.run() has no loop_factory before 3.12; only uvloop
+        # supplies one here, so install its policy instead
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        asyncio.run(main)
+
+
+Server = Union[EchoServer, WebServer]
+
+
+def _make_echo(server_config: ServerConfig, manager: 'ServerManager') -> EchoServer:
+    """Create an echo server from its configuration."""
+    return EchoServer(
+        port=server_config.port,
+        bind_address=server_config.bind_address
+    )
+
+
+def _make_web(server_config: ServerConfig, manager: 'ServerManager') -> WebServer:
+    """Create a web server from its configuration."""
+    # All web servers share one aiohttp application and runner
+    if manager.web_app is None:
+        manager.web_app = SharedWebApp()
+    return WebServer(
+        port=server_config.port,
+        content=server_config.content,
+        bind_address=server_config.bind_address,
+        shared=manager.web_app
+    )
+
+
+# Maps a configured server type to the factory that builds it
+_SERVER_FACTORIES: Dict[str, Callable[[ServerConfig, 'ServerManager'], Server]] = {
+    'echo': _make_echo,
+    'web': _make_web,
+}
+
+
+def _server_key(server_config: ServerConfig) -> Tuple[str, int]:
+    """Identify a configured server across configuration reloads."""
+    return (server_config.type, server_config.port)
+
+
 class ServerManager:
     """Manages multiple server instances."""
 
@@ -76,32 +158,38 @@ class ServerManager:
             config: Configuration object
         """
         self.config = config
-        self.servers: List[Union[EchoServer, WebServer]] = []
+        self.servers: List[Server] = []
         self.tasks: List[asyncio.Task] = []
+        self.web_app: Optional[SharedWebApp] = None
+        self._servers_by_key: Dict[Tuple[str, int], Server] = {}
+        self._server_tasks: Dict[Server, asyncio.Task] = {}
         self._shutdown = False
 
     def create_servers(self) -> None:
         """Create server instances from configuration."""
         for server_config in self.config.servers:
-            if server_config.type == 'echo':
-                server = EchoServer(
-                    port=server_config.port,
-                    bind_address=server_config.bind_address
-                )
-            elif server_config.type == 'web':
-                server = WebServer(
-                    port=server_config.port,
-                    content=server_config.content,
-                    bind_address=server_config.bind_address
-                )
-            else:
-                logger.error(f"Unknown server type: {server_config.type}")
-                continue
-
-            self.servers.append(server)
+            server = self._create_server(server_config)
+            if server is not None:
+                self.servers.append(server)
+                self._servers_by_key[_server_key(server_config)] = server
 
         logger.info(f"Created {len(self.servers)} server instance(s)")
 
+    def _create_server(self, server_config: ServerConfig) -> Optional[Server]:
+        """Create a single server instance from its configuration.
+
+        Args:
+            server_config: Configuration for the server
+
+        Returns:
+            Server instance, or None if the server type is unknown
+        """
+        factory = _SERVER_FACTORIES.get(server_config.type)
+        if factory is None:
+            logger.error(f"Unknown server type: {server_config.type}")
+            return None
+        return factory(server_config, self)
+
     async def start_all(self) -> None:
         """Start all configured servers."""
         if not self.servers:
@@ -114,25 +202,25 @@ class ServerManager:
         for server in self.servers:
             task = asyncio.create_task(server.start())
             self.tasks.append(task)
+            self._server_tasks[server] = task
 
         # Log server summary
         print("\n" + "="*60)
         print("SimpleTCPResponder - Active Servers")
         print("="*60)
 
-        # Check if any server is bound to all interfaces
-        has_wildcard_bind = any(
-            server.bind_address == '0.0.0.0' for server in self.servers
-        )
+        # List servers, noting whether any is bound to all interfaces
+        has_wildcard_bind = False
+        for server in self.servers:
+            print(f"  {server.display_label}")
+            has_wildcard_bind = has_wildcard_bind or server.bind_address == '0.0.0.0'
 
-        # Get active IP addresses if we have wildcard binds
+        # Only look up active IP addresses if we have wildcard binds
         active_ips = []
         if has_wildcard_bind:
-            active_ips = get_active_ip_addresses()
-
-        for server in self.servers:
-            server_type = server.__class__.__name__.replace('Server', '')
-            print(f"  {server_type.upper()}: {server.bind_address}:{server.port}")
+            # Hostname resolution can block, so keep it off the event loop
+            loop = asyncio.get_running_loop()
+            active_ips = await loop.run_in_executor(None, get_active_ip_addresses)
 
         # Display active IP addresses if binding to all interfaces
         if active_ips:
@@ -171,6 +259,9 @@ class ServerManager:
         if stop_tasks:
             await asyncio.gather(*stop_tasks, return_exceptions=True)
 
+        if self.web_app is not None:
+            await self.web_app.cleanup()
+
         # Cancel all tasks
         for task in self.tasks:
             if not task.done():
@@ -178,26 +269,165 @@ class ServerManager:
 
         logger.info("All servers stopped")
 
+    async def apply_config(self, new_config: Config) -> None:
+        """Bring running servers in line with a new configuration.
+
+        Unchanged servers keep their listening sockets, web servers whose
+        content changed are updated in place, and everything else is
+        stopped or started as needed. Servers that failed to start are
+        retried.
+
+        Args:
+            new_config: Validated configuration to apply
+        """
+        old_configs = {_server_key(c): c for c in self.config.servers}
+        new_configs = {_server_key(c): c for c in new_config.servers}
+
+        # Stop removed servers first so their ports are free for new ones
+        for key, old in old_configs.items():
+            new = new_configs.get(key)
+            server = self._servers_by_key.get(key)
+            if server is None:
+                continue
+
+            if not self._is_serving(server):
+                # It failed to start (e.g. port busy); drop it so it is
+                # started afresh below if it is still configured
+                await self._stop_server(server)
+                self.servers.remove(server)
+                del self._servers_by_key[key]
+                continue
+
+            if new == old:
+                continue
+
+            if (new is not None and isinstance(server, WebServer)
+                    and new.bind_address == old.bind_address):
+                server.set_content(new.content)
+                continue
+
+            await self._stop_server(server)
+            self.servers.remove(server)
+            del self._servers_by_key[key]
+
+        # Servers that failed to start stay unregistered, so the next
+        # reload tries them again
+        for key, new in new_configs.items():
+            if key in self._servers_by_key:
+                continue
+            server = self._create_server(new)
+            if server is None or not await self._start_server(server):
+                continue
+            self.servers.append(server)
+            self._servers_by_key[key] = server
+            logger.info(f"Started {new.type} server on {new.bind_address}:{new.port}")
+
+        self.config = new_config
+
+    def _is_serving(self, server: Server) -> bool:
+        """Check whether a started server's task is still running.
+
+        Args:
+            server: Server to check
+
+        Returns:
+            False if the server was never started or its task has ended
+        """
+        task = self._server_tasks.get(server)
+        return task is not None and not task.done()
+
+    async def _start_server(self, server: Server) -> bool:
+        """Start a server and wait until it is listening.
+
+        Args:
+            server: Server to start
+
+        Returns:
+            True if the server is listening, False if it failed to start
+        """
+        task = asyncio.create_task(server.start())
+        ready = asyncio.ensure_future(server.wait_ready())
+        await asyncio.wait({task, ready}, return_when=asyncio.FIRST_COMPLETED)
+
+        if not ready.done():
+            # start() returned or raised before the server was listening;
+            # it has already logged why
+            ready.cancel()
+            if not task.cancelled():
+                task.exception()
+            return False
+
+        self.tasks.append(task)
+        self._server_tasks[server] = task
+        return True
+
+    async def _stop_server(self, server: Server) -> None:
+        """Stop a server and forget its task.
+
+        Args:
+            server: Server to stop
+        """
+        await server.stop()
+        task = self._server_tasks.pop(server, None)
+        if task is not None:
+            await asyncio.gather(task, return_exceptions=True)
+            self.tasks.remove(task)
+
+    async def watch(self, path: str, interval: float = 2.0) -> None:
+        """Poll a configuration file and apply changes as they appear.
+
+        Args:
+            path: Configuration file to watch
+            interval: Seconds between checks
+        """
+        last_error = None
+        while not self._shutdown:
+            await asyncio.sleep(interval)
+
+            try:
+                # Config.load returns the cached instance while the file is unchanged
+                new_config = Config.load(path)
+            except Exception as e:
+                if str(e) != last_error:
+                    logger.warning(f"Ignoring invalid configuration in {path}: {e}")
+                    last_error = str(e)
+                continue
+
+            last_error = None
+            if new_config is self.config:
+                continue
+
+            logger.info(f"Configuration file {path} changed, reloading")
+            await self.apply_config(new_config)
+
+    def _on_signal(self, sig: signal.Signals) -> None:
+        """Begin shutdown when a termination signal arrives.
+
+        Args:
+            sig: Signal that was received
+        """
+        if self._shutdown:
+            return
+        logger.info(f"Received signal {sig}")
+        asyncio.ensure_future(self.stop_all())
+
     def setup_signal_handlers(self, loop: asyncio.AbstractEventLoop) -> None:
         """Set up signal handlers for graceful shutdown.
 
         Args:
             loop: Event loop
         """
-        def signal_handler(sig):
-            logger.info(f"Received signal {sig}")
-            loop.create_task(self.stop_all())
-
         # Handle SIGINT (Ctrl+C) and SIGTERM
         for sig in (signal.SIGINT, signal.SIGTERM):
-            loop.add_signal_handler(sig, lambda s=sig: signal_handler(s))
+            loop.add_signal_handler(sig, self._on_signal, sig)
 
 
-async def run_servers(config: Config) -> None:
+async def run_servers(config: Config, watch_path: Optional[str] = None) -> None:
     """Run all configured servers.
 
     Args:
         config: Configuration object
+        watch_path: Configuration file to watch for changes (default: no hot reload)
     """
     manager = ServerManager(config)
     manager.create_servers()
@@ -210,6 +440,10 @@ async def run_servers(config: Config) -> None:
     loop = asyncio.get_event_loop()
     manager.setup_signal_handlers(loop)
 
+    # The watcher keeps running (and start_all waiting) until shutdown
+    if watch_path is not None:
+        manager.tasks.append(asyncio.create_task(manager.watch(watch_path)))
+
     try:
         await manager.start_all()
     except KeyboardInterrupt:
@@ -235,6 +469,11 @@ def main():
         action='store_true',
         help='Enable verbose logging'
     )
+    parser.add_argument(
+        '--hot-reload',
+        action='store_true',
+        help='Watch the configuration file and apply changes without restarting'
+    )
     args = parser.parse_args()
 
     # Set logging level
@@ -253,9 +492,13 @@ def main():
         logger.error(f"Error loading configuration: {e}")
         sys.exit(1)
 
+    loop_factory = get_uvloop_factory()
+    if loop_factory is not None:
+        logger.debug("Using uvloop event loop")
+
     # Run servers
     try:
-        asyncio.run(run_servers(config))
+        run_event_loop(run_servers(config, args.config if args.hot_reload else None), loop_factory)
     except KeyboardInterrupt:
         logger.info("Shutdown complete")
 
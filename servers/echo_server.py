@@ -2,10 +2,67 @@
 
 import asyncio
 import logging
-from typing import Optional
+import socket
+from typing import Optional, Set
 
 logger = logging.getLogger(__name__)
 
+# Listen backlog and per-socket receive buffer for bulk echo traffic
+LISTEN_BACKLOG = 1024
+RECV_BUFFER_SIZE = 1 << 20
+
+
+class EchoProtocol(asyncio.Protocol):
+    """Protocol that writes every received chunk straight back to the peer.
+
+    asyncio calls data_received at most once per socket per loop iteration,
+    so chunks are written immediately rather than batched: a flush deferred
+    with call_soon would run before the next read and never merge anything.
+    """
+
+    def __init__(self, server: 'EchoServer'):
+        """Initialize echo protocol.
+
+        Args:
+            server: Echo server that accepted the connection
+        """
+        self.server = server
+        self.transport: Optional[asyncio.Transport] = None
+        self.peername = None
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        """Register a newly accepted connection."""
+        self.transport = transport
+        self.peername = transport.get_extra_info('peername')
+        self.server._transports.add(transport)
+        logger.info("Echo server on port %s: New connection from %s", self.server.port, self.peername)
+
+    def data_received(self, data: bytes) -> None:
+        """Echo received data back to the client."""
+        # Only decode (a prefix of) the payload when it will actually be logged
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Echo server on port %s: Received from %s: %s",
+                         self.server.port, self.peername,
+                         data[:50].decode('utf-8', errors='replace'))
+
+        self.transport.write(data)
+
+    def pause_writing(self) -> None:
+        """Stop reading while the client is not draining its echoes."""
+        self.transport.pause_reading()
+
+    def resume_writing(self) -> None:
+        """Resume reading once the write buffer has drained."""
+        self.transport.resume_reading()
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        """Unregister a closed connection."""
+        if exc is not None:
+            logger.error("Echo server on port %s: Error handling client %s: %s",
+                         self.server.port, self.peername, exc)
+        logger.info("Echo server on port %s: Closing connection from %s", self.server.port, self.peername)
+        self.server._transports.discard(self.transport)
+
 
 class EchoServer:
     """TCP Echo server that returns received data."""
@@ -19,52 +76,36 @@ class EchoServer:
         """
         self.port = port
         self.bind_address = bind_address
+        self.display_label = f"ECHO: {bind_address}:{port}"
+        self.bound_port: Optional[int] = None  # Actual port once listening (port may be 0)
         self.server: Optional[asyncio.Server] = None
         self._running = False
-
-    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
-        """Handle incoming client connection.
-
-        Args:
-            reader: Stream reader for incoming data
-            writer: Stream writer for outgoing data
-        """
-        addr = writer.get_extra_info('peername')
-        logger.info(f"Echo server on port {self.port}: New connection from {addr}")
-
-        try:
-            while True:
-                data = await reader.read(1024)
-                if not data:
-                    break
-
-                message = data.decode('utf-8', errors='replace')
-                logger.debug(f"Echo server on port {self.port}: Received from {addr}: {message[:50]}")
-
-                # Echo back the data
-                writer.write(data)
-                await writer.drain()
-
-        except asyncio.CancelledError:
-            logger.info(f"Echo server on port {self.port}: Connection from {addr} cancelled")
-        except Exception as e:
-            logger.error(f"Echo server on port {self.port}: Error handling client {addr}: {e}")
-        finally:
-            logger.info(f"Echo server on port {self.port}: Closing connection from {addr}")
-            writer.close()
-            await writer.wait_closed()
+        self._ready: Optional[asyncio.Event] = None
+        self._transports: Set[asyncio.BaseTransport] = set()
 
     async def start(self) -> None:
         """Start the echo server."""
         try:
-            self.server = await asyncio.start_server(
-                self.handle_client,
+            loop = asyncio.get_running_loop()
+            self.server = await loop.create_server(
+                lambda: EchoProtocol(self),
                 self.bind_address,
-                self.port
+                self.port,
+                backlog=LISTEN_BACKLOG
             )
+            # Accepted connections inherit the listener's buffer size.
+            # asyncio already enables TCP_NODELAY on accepted sockets.
+            for sock in self.server.sockets:
+                try:
+                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, RECV_BUFFER_SIZE)
+                except OSError as e:
+                    logger.debug(f"Echo server on port {self.port}: Could not set SO_RCVBUF: {e}")
+            addr = self.server.sockets[0].getsockname()
+            self.bound_port = addr[1]
+
             self._running = True
+            self._ready_event().set()
 
-            addr = self.server.sockets[0].getsockname()
             logger.info(f"Echo server started on {addr[0]}:{addr[1]}")
 
             async with self.server:
@@ -83,9 +124,26 @@ class EchoServer:
         if self.server:
             logger.info(f"Stopping echo server on port {self.port}")
             self.server.close()
+            for transport in list(self._transports):
+                transport.close()
             await self.server.wait_closed()
             self._running = False
 
+    def _ready_event(self) -> asyncio.Event:
+        """Get the readiness event, creating it inside the running loop.
+
+        It is not created in __init__, where Python 3.8/3.9 would bind it to
+        whichever loop is current. Both start() and wait_ready() may be first
+        to run, so either creates it.
+        """
+        if self._ready is None:
+            self._ready = asyncio.Event()
+        return self._ready
+
+    async def wait_ready(self) -> None:
+        """Wait until the server is listening."""
+        await self._ready_event().wait()
+
     def is_running(self) -> bool:
         """Check if server is running."""
         return self._running
@@ -2,29 +2,111 @@
 
 import asyncio
 import logging
-from typing import Optional
+import os
+import tempfile
+from typing import Dict, Optional
 from aiohttp import web
 
 logger = logging.getLogger(__name__)
 
+# Bodies at least this large are served from a temp file so the kernel can
+# sendfile() them instead of copying the bytes through Python per request
+SENDFILE_THRESHOLD = 64 * 1024
+
+
+def _detect_content_type(content: str) -> str:
+    """Guess whether content is HTML or plain text.
+
+    Args:
+        content: Content to inspect
+
+    Returns:
+        'text/html' or 'text/plain'
+    """
+    head = content.lstrip()[:9].lower()
+    if head.startswith('<!doctype') or head.startswith('<html'):
+        return 'text/html'
+    return 'text/plain'
+
 
 class WebServer:
     """HTTP server that serves configurable content."""
 
-    def __init__(self, port: int, content: str, bind_address: str = '0.0.0.0'):
+    def __init__(self, port: int, content: str, bind_address: str = '0.0.0.0',
+                 shared: Optional['SharedWebApp'] = None):
         """Initialize web server.
 
         Args:
             port: Port to listen on
             content: Content to serve (HTML, text, etc.)
             bind_address: Address to bind to (default: 0.0.0.0)
+            shared: Shared application to serve from (default: use a private one)
         """
         self.port = port
-        self.content = content
         self.bind_address = bind_address
+        self.display_label = f"WEB: {bind_address}:{port}"
+        self.bound_port: Optional[int] = None  # Actual port once listening (port may be 0)
+        self._body_file: Optional[str] = None  # Stable temp file owned by this server
+        self._body_path: Optional[str] = None  # File currently served, if any
+        self._prepare_content(content)
+
         self.app: Optional[web.Application] = None
         self.runner: Optional[web.AppRunner] = None
+        self._shared = shared
+        self._site: Optional[web.TCPSite] = None
         self._running = False
+        self._ready: Optional[asyncio.Event] = None
+        self._stop_event: Optional[asyncio.Event] = None
+
+    def _prepare_content(self, content: str) -> None:
+        """Build the response body and headers for content.
+
+        This runs once per content change rather than once per request.
+
+        Args:
+            content: Content to serve
+        """
+        self.content = content
+        self._content_type = _detect_content_type(content)
+        self._body = content.encode('utf-8')
+        self._headers = {
+            'Server': 'SimpleTCPResponder',
+            'X-Served-Port': str(self.bound_port or self.port),
+            'Content-Type': f'{self._content_type}; charset=utf-8'
+        }
+
+    def _write_body_file(self) -> None:
+        """Store a large body in a temp file for sendfile(), or stop serving it.
+
+        The file lives at one path for the server's lifetime and new content
+        is swapped in with os.replace(), so a request that is about to open
+        the file gets either the old or the new body, never a missing file.
+        """
+        if len(self._body) < SENDFILE_THRESHOLD:
+            # Keep any existing file until stop(); in-flight responses may open it
+            self._body_path = None
+            return
+
+        if self._body_file is None:
+            fd, self._body_file = tempfile.mkstemp(prefix='simpletcp-', suffix='.body')
+            os.close(fd)
+
+        with tempfile.NamedTemporaryFile(dir=os.path.dirname(self._body_file), prefix='simpletcp-',
+                                         suffix='.tmp', delete=False) as f:
+            f.write(self._body)
+        os.replace(f.name, self._body_file)
+        self._body_path = self._body_file
+
+    def set_content(self, content: str) -> None:
+        """Replace the served content without restarting the server.
+
+        Args:
+            content: New content to serve
+        """
+        self._prepare_content(content)
+        if self._running:
+            self._write_body_file()
+        logger.info(f"Web server on port {self.port}: Content updated")
 
     async def handle_request(self, request: web.Request) -> web.Response:
         """Handle HTTP request.
@@ -41,39 +123,48 @@ class WebServer:
 
         logger.info(f"Web server on port {self.port}: {method} {path} from {client_ip}")
 
-        # Determine content type based on content
-        if self.content.strip().startswith('<!DOCTYPE') or self.content.strip().startswith('<html'):
-            content_type = 'text/html'
-        else:
-            content_type = 'text/plain'
-
-        return web.Response(
-            text=self.content,
-            content_type=content_type,
-            headers={
-                'Server': 'SimpleTCPResponder',
-                'X-Served-Port': str(self.port)
-            }
-        )
+        body_path = self._body_path
+        if body_path is not None:
+            return web.FileResponse(body_path, headers=self._headers)
+        return web.Response(body=self._body, headers=self._headers)
 
     async def start(self) -> None:
         """Start the web server."""
+        self._stop_event = asyncio.Event()
         try:
-            self.app = web.Application()
-            self.app.router.add_route('*', '/{tail:.*}', self.handle_request)
+            self._write_body_file()
+
+            if self._shared is not None:
+                await self._shared.setup()
+                self.app = self._shared.app
+                self.runner = self._shared.runner
+            else:
+                self.app = web.Application()
+                self.app.router.add_route('*', '/{tail:.*}', self.handle_request)
 
-            self.runner = web.AppRunner(self.app)
-            await self.runner.setup()
+                self.runner = web.AppRunner(self.app)
+                await self.runner.setup()
 
             site = web.TCPSite(self.runner, self.bind_address, self.port)
+            self._site = site
             await site.start()
+            if self._site is not site:
+                # stop() ran while the site was starting
+                return
+            self.bound_port = site._server.sockets[0].getsockname()[1]
+            if self.port == 0:
+                # Report the assigned port rather than 0 in responses
+                self._prepare_content(self.content)
+
+            if self._shared is not None:
+                self._shared.register(self)
 
             self._running = True
+            self._ready_event().set()
             logger.info(f"Web server started on {self.bind_address}:{self.port}")
 
-            # Keep the server running
-            while self._running:
-                await asyncio.sleep(1)
+            # Keep the server running until stop() is called
+            await self._stop_event.wait()
 
         except OSError as e:
             logger.error(f"Web server failed to start on {self.bind_address}:{self.port}: {e}")
@@ -85,11 +176,97 @@ class WebServer:
 
     async def stop(self) -> None:
         """Stop the web server."""
-        if self.runner:
+        if self._stop_event is not None:
+            self._stop_event.set()
+
+        if self._shared is not None:
+            # Only close our own listener; the shared runner outlives us
+            if self._site is not None:
+                logger.info(f"Stopping web server on port {self.port}")
+                self._shared.unregister(self)
+                site, self._site = self._site, None
+                await site.stop()
+                self._running = False
+        elif self.runner:
             logger.info(f"Stopping web server on port {self.port}")
             await self.runner.cleanup()
             self._running = False
 
+        self._body_path = None
+        if self._body_file is not None:
+            try:
+                os.unlink(self._body_file)
+            except OSError:
+                pass
+            self._body_file = None
+
+    def _ready_event(self) -> asyncio.Event:
+        """Get the readiness event, creating it inside the running loop.
+
+        Like _stop_event it is not created in __init__, where
+        Python 3.8/3.9 would bind it to whichever loop is current. Both
+        start() and wait_ready() may be first to run, so either creates it.
+        """
+        if self._ready is None:
+            self._ready = asyncio.Event()
+        return self._ready
+
+    async def wait_ready(self) -> None:
+        """Wait until the server is listening."""
+        await self._ready_event().wait()
+
     def is_running(self) -> bool:
         """Check if server is running."""
         return self._running
+
+
+class SharedWebApp:
+    """A single aiohttp application and runner shared by several WebServers.
+
+    Each WebServer adds its own TCPSite to the shared runner; requests are
+    dispatched to the server registered for the local port they arrived on.
+    """
+
+    def __init__(self):
+        """Initialize shared application."""
+        self.app = web.Application()
+        self.app.router.add_route('*', '/{tail:.*}', self.handle_request)
+        self.runner = web.AppRunner(self.app)
+        self._servers: Dict[int, WebServer] = {}
+        self._setup: Optional[asyncio.Future] = None
+
+    async def setup(self) -> None:
+        """Set up the shared runner (only the first call does any work)."""
+        if self._setup is None:
+            self._setup = asyncio.ensure_future(self.runner.setup())
+        await self._setup
+
+    def register(self, server: WebServer) -> None:
+        """Route requests arriving on the server's port to it."""
+        self._servers[server.bound_port] = server
+
+    def unregister(self, server: WebServer) -> None:
+        """Stop routing requests to the server."""
+        if self._servers.get(server.bound_port) is server:
+            del self._servers[server.bound_port]
+
+    async def handle_request(self, request: web.Request) -> web.StreamResponse:
+        """Dispatch a request to the WebServer listening on its local port.
+
+        Args:
+            request: Incoming HTTP request
+
+        Returns:
+            HTTP response from the matching server
+        """
+        sockname = request.transport.get_extra_info('sockname') if request.transport else None
+        server = self._servers.get(sockname[1]) if sockname else None
+        if server is None:
+            raise web.HTTPNotFound()
+        return await server.handle_request(request)
+
+    async def cleanup(self) -> None:
+        """Shut down the shared runner and any remaining sites."""
+        if self._setup is not None:
+            await self.runner.cleanup()
+            self._setup = None
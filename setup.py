@@ -4,11 +4,38 @@
 import argparse
 import os
 import sys
-from typing import List
+from typing import List, Set
 
 from config import Config, ServerConfig, get_default_config_path
 
 
+# Default page for an individually configured web server
+_DEFAULT_HTML = """<!DOCTYPE html>
+<html>
+<head>
+    <title>SimpleTCPResponder - Port {port}</title>
+</head>
+<body>
+    <h1>SimpleTCPResponder</h1>
+    <p>This is a diagnostic web server running on port {port}.</p>
+    <p>Server type: {server_type}</p>
+    <p>Timestamp: {{timestamp}}</p>
+</body>
+</html>"""
+
+# Default page for each web server created by the quick setup
+_SEQUENTIAL_HTML = """<!DOCTYPE html>
+<html>
+<head>
+    <title>SimpleTCPResponder - Port {port}</title>
+</head>
+<body>
+    <h1>SimpleTCPResponder - Server {idx}</h1>
+    <p>This is a diagnostic web server running on port {port}.</p>
+</body>
+</html>"""
+
+
 def get_yes_no(prompt: str, default: bool = False) -> bool:
     """Get yes/no input from user.
 
@@ -85,12 +112,12 @@ def get_server_type() -> str:
             print("Please enter 1 or 2")
 
 
-def configure_server(server_num: int, used_ports: List[int]) -> ServerConfig:
+def configure_server(server_num: int, used_ports: Set[int]) -> ServerConfig:
     """Configure a single server.
 
     Args:
         server_num: Server number (for display)
-        used_ports: List of already used ports
+        used_ports: Set of already used ports
 
     Returns:
         Configured ServerConfig
@@ -119,27 +146,22 @@ def configure_server(server_num: int, used_ports: List[int]) -> ServerConfig:
 
         if choice == '1':
             print("\nEnter content (press Ctrl+D or Ctrl+Z when done):")
-            lines = []
-            try:
-                while True:
-                    line = input()
-                    lines.append(line)
-            except EOFError:
-                pass
-            content = '\n'.join(lines)
+            if not sys.stdin.isatty():
+                # Piped input: read it all at once instead of line by line
+                content = sys.stdin.read()
+                if content.endswith('\n'):
+                    content = content[:-1]
+            else:
+                lines = []
+                try:
+                    while True:
+                        line = input()
+                        lines.append(line)
+                except EOFError:
+                    pass
+                content = '\n'.join(lines)
         else:
-            content = f"""<!DOCTYPE html>
-<html>
-<head>
-    <title>SimpleTCPResponder - Port {port}</title>
-</head>
-<body>
-    <h1>SimpleTCPResponder</h1>
-    <p>This is a diagnostic web server running on port {port}.</p>
-    <p>Server type: {server_type}</p>
-    <p>Timestamp: {{timestamp}}</p>
-</body>
-</html>"""
+            content = _DEFAULT_HTML.format(port=port, server_type=server_type)
 
     return ServerConfig(
         type=server_type,
@@ -165,16 +187,7 @@ def setup_sequential_ports(start_port: int, count: int, server_type: str) -> Lis
         port = start_port + i
         content = None
         if server_type == 'web':
-            content = f"""<!DOCTYPE html>
-<html>
-<head>
-    <title>SimpleTCPResponder - Port {port}</title>
-</head>
-<body>
-    <h1>SimpleTCPResponder - Server {i+1}</h1>
-    <p>This is a diagnostic web server running on port {port}.</p>
-</body>
-</html>"""
+            content = _SEQUENTIAL_HTML.format(port=port, idx=i + 1)
 
         servers.append(ServerConfig(
             type=server_type,
@@ -185,13 +198,98 @@ def setup_sequential_ports(start_port: int, count: int, server_type: str) -> Lis
     return servers
 
 
+def prompt_for_servers() -> List[ServerConfig]:
+    """Interactively configure servers.
+
+    Returns:
+        List of ServerConfig objects
+    """
+    # Setup mode
+    print("\nSetup modes:")
+    print("  1. Configure servers individually")
+    print("  2. Quick setup - multiple servers on sequential ports")
+    mode = input("Select mode [1-2]: ").strip()
+
+    servers = []
+
+    if mode == '2':
+        # Quick setup
+        num_servers = get_number("\nHow many servers?", min_val=1, max_val=10)
+        server_type = get_server_type()
+        start_port = get_number("Starting port number", min_val=1, max_val=65535-num_servers)
+
+        servers = setup_sequential_ports(start_port, num_servers, server_type)
+        print(f"\nCreated {num_servers} {server_type} server(s) on ports {start_port}-{start_port+num_servers-1}")
+
+    else:
+        # Individual configuration
+        num_servers = get_number("\nHow many servers do you want to configure?", min_val=1, max_val=10)
+
+        used_ports: Set[int] = set()
+        for i in range(num_servers):
+            server = configure_server(i + 1, used_ports)
+            servers.append(server)
+            used_ports.add(server.port)
+
+    return servers
+
+
+def parse_server_specs(specs: List[str]) -> List[ServerConfig]:
+    """Build server configurations from --servers command line values.
+
+    Each value is a comma-separated list of ``type:port[:content_file]``
+    entries, e.g. ``echo:8000,web:8080:index.html``. Web servers without a
+    content file get the default HTML page.
+
+    Args:
+        specs: Values passed to --servers
+
+    Returns:
+        List of ServerConfig objects
+    """
+    servers = []
+    for spec in specs:
+        for entry in spec.split(','):
+            entry = entry.strip()
+            if not entry:
+                continue
+
+            parts = entry.split(':', 2)
+            if len(parts) < 2:
+                raise ValueError(f"Expected type:port[:content_file], got '{entry}'")
+            server_type, port_str = parts[0].strip().lower(), parts[1].strip()
+            try:
+                port = int(port_str)
+            except ValueError:
+                raise ValueError(f"Invalid port '{port_str}' in '{entry}'") from None
+
+            content = None
+            if len(parts) == 3:
+                with open(parts[2], 'r') as f:
+                    content = f.read()
+            elif server_type == 'web':
+                content = _DEFAULT_HTML.format(port=port, server_type=server_type)
+
+            servers.append(ServerConfig(type=server_type, port=port, content=content))
+
+    return servers
+
+
 def main():
     """Main setup function."""
     parser = argparse.ArgumentParser(description='SimpleTCPResponder Setup')
     parser.add_argument('--use-prefs', help='Use existing preferences file')
     parser.add_argument('--output', '-o', help='Output configuration file path')
+    parser.add_argument(
+        '--servers',
+        action='append',
+        help='Configure servers without prompting, e.g. echo:8000,web:8080:index.html'
+    )
     args = parser.parse_args()
 
+    if args.servers and args.use_prefs:
+        parser.error('--servers cannot be combined with --use-prefs')
+
     config_path = args.output or get_default_config_path()
 
     print("="*60)
@@ -215,7 +313,7 @@ def main():
             print(f"Configuration file not found: {args.use_prefs}")
             sys.exit(1)
 
-    if not args.use_prefs and os.path.exists(config_path):
+    if not args.use_prefs and not args.servers and os.path.exists(config_path):
         if get_yes_no(f"\nConfiguration file already exists at {config_path}. Reuse it?", default=True):
             try:
                 config = Config.load(config_path)
@@ -225,32 +323,15 @@ def main():
                 print(f"Error loading configuration: {e}")
                 print("Creating new configuration...\n")
 
-    # Setup mode
-    print("\nSetup modes:")
-    print("  1. Configure servers individually")
-    print("  2. Quick setup - multiple servers on sequential ports")
-    mode = input("Select mode [1-2]: ").strip()
-
-    servers = []
-
-    if mode == '2':
-        # Quick setup
-        num_servers = get_number("\nHow many servers?", min_val=1, max_val=10)
-        server_type = get_server_type()
-        start_port = get_number("Starting port number", min_val=1, max_val=65535-num_servers)
-
-        servers = setup_sequential_ports(start_port, num_servers, server_type)
-        print(f"\nCreated {num_servers} {server_type} server(s) on ports {start_port}-{start_port+num_servers-1}")
-
+    if args.servers:
+        # Non-interactive: build servers straight from the command line
+        try:
+            servers = parse_server_specs(args.servers)
+        except (OSError, ValueError) as e:
+            print(f"\nInvalid --servers value: {e}")
+            sys.exit(1)
     else:
-        # Individual configuration
-        num_servers = get_number("\nHow many servers do you want to configure?", min_val=1, max_val=10)
-
-        used_ports = []
-        for i in range(num_servers):
-            server = configure_server(i + 1, used_ports)
-            servers.append(server)
-            used_ports.append(server.port)
+        servers = prompt_for_servers()
 
     # Create and save configuration
     config = Config(servers=servers)
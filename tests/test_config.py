@@ -1,5 +1,6 @@
 """Tests for configuration module."""
 
+import dataclasses
 import os
 import tempfile
 import pytest
@@ -110,3 +111,100 @@ def test_config_to_from_dict():
     assert restored_config.servers[0].type == 'echo'
     assert restored_config.servers[0].port == 8000
     assert restored_config.servers[0].bind_address == '127.0.0.1'
+
+
+def test_config_load_cache():
+    """Test that unchanged files are served from the load cache."""
+    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
+        temp_path = f.name
+
+    try:
+        Config(servers=[ServerConfig(type='echo', port=8000)]).save(temp_path)
+
+        first = Config.load(temp_path)
+        assert Config.load(temp_path) is first
+
+        # Rewriting the file changes its size, so the cache entry is stale
+        Config(servers=[
+            ServerConfig(type='echo', port=8000),
+            ServerConfig(type='echo', port=8001)
+        ]).save(temp_path)
+        reloaded = Config.load(temp_path)
+        assert reloaded is not first
+        assert len(reloaded.servers) == 2
+
+        Config.invalidate_cache(temp_path)
+        assert Config.load(temp_path) is not reloaded
+
+    finally:
+        Config.invalidate_cache()
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def test_config_save_compact():
+    """Test saving minified configuration."""
+    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
+        temp_path = f.name
+
+    try:
+        config = Config(servers=[ServerConfig(type='echo', port=8000)])
+        config.save(temp_path, compact=True)
+
+        with open(temp_path) as f:
+            text = f.read()
+        assert '\n' not in text
+        assert ' ' not in text
+
+        loaded = Config.load(temp_path)
+        assert loaded.servers[0].port == 8000
+
+    finally:
+        Config.invalidate_cache()
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def test_config_is_immutable():
+    """Test that loaded configurations cannot be modified in place."""
+    server = ServerConfig(type='echo', port=8000)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        server.port = 8001
+
+    config = Config(servers=[server])
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.servers = []
+
+    # The server list itself is immutable too, so cached configs stay intact
+    assert isinstance(config.servers, tuple)
+    with pytest.raises(AttributeError):
+        config.servers.append(ServerConfig(type='echo', port=8001))
+
+    assert hash(config) == hash(Config(servers=[ServerConfig(type='echo', port=8000)]))
+    assert isinstance(Config.from_dict(config.to_dict()).servers, tuple)
+
+
+@pytest.mark.parametrize("save_with_orjson", [True, False])
+def test_config_non_ascii_round_trip(monkeypatch, save_with_orjson):
+    """Test non-ASCII content survives saving and loading with either encoder."""
+    import config as config_module
+    if config_module.orjson is None:
+        pytest.skip("orjson not installed")
+    orjson = config_module.orjson
+
+    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
+        temp_path = f.name
+
+    try:
+        content = 'Grüße — 日本語'
+        monkeypatch.setattr(config_module, 'orjson', orjson if save_with_orjson else None)
+        Config(servers=[ServerConfig(type='web', port=8080, content=content)]).save(temp_path)
+
+        # Load through the other code path
+        monkeypatch.setattr(config_module, 'orjson', None if save_with_orjson else orjson)
+        assert Config.load(temp_path).servers[0].content == content
+
+    finally:
+        Config.invalidate_cache()
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
@@ -1,6 +1,8 @@
 """Tests for echo server."""
 
 import asyncio
+import hashlib
+import os
 import pytest
 from servers.echo_server import EchoServer
 
@@ -8,17 +10,17 @@ from servers.echo_server import EchoServer
 @pytest.mark.asyncio
 async def test_echo_server_basic():
     """Test basic echo server functionality."""
-    server = EchoServer(port=9999, bind_address='127.0.0.1')
+    server = EchoServer(port=0, bind_address='127.0.0.1')
 
     # Start server in background
     server_task = asyncio.create_task(server.start())
 
-    # Give server time to start
-    await asyncio.sleep(0.5)
+    # Wait until the server is listening
+    await asyncio.wait_for(server.wait_ready(), timeout=2.0)
 
     try:
         # Connect and send data
-        reader, writer = await asyncio.open_connection('127.0.0.1', 9999)
+        reader, writer = await asyncio.open_connection('127.0.0.1', server.bound_port)
 
         # Send test message
         test_message = b'Hello, Echo!'
@@ -46,13 +48,13 @@ async def test_echo_server_basic():
 @pytest.mark.asyncio
 async def test_echo_server_multiple_messages():
     """Test echo server with multiple messages."""
-    server = EchoServer(port=9998, bind_address='127.0.0.1')
+    server = EchoServer(port=0, bind_address='127.0.0.1')
 
     server_task = asyncio.create_task(server.start())
-    await asyncio.sleep(0.5)
+    await asyncio.wait_for(server.wait_ready(), timeout=2.0)
 
     try:
-        reader, writer = await asyncio.open_connection('127.0.0.1', 9998)
+        reader, writer = await asyncio.open_connection('127.0.0.1', server.bound_port)
 
         # Send multiple messages
         messages = [b'Message 1', b'Message 2', b'Message 3']
@@ -73,3 +75,39 @@ async def test_echo_server_multiple_messages():
             await server_task
         except asyncio.CancelledError:
             pass
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("size", [1 << 10, 1 << 20, 1 << 24])
+async def test_echo_server_bulk(size):
+    """Test echo server with bulk payloads."""
+    server = EchoServer(port=0, bind_address='127.0.0.1')
+
+    server_task = asyncio.create_task(server.start())
+    await asyncio.wait_for(server.wait_ready(), timeout=2.0)
+
+    try:
+        reader, writer = await asyncio.open_connection('127.0.0.1', server.bound_port)
+        payload = os.urandom(size)
+
+        async def send():
+            writer.write(payload)
+            await writer.drain()
+
+        # Read concurrently: the server stops reading while its echoes
+        # are not being consumed, so sending everything first would stall
+        _, response = await asyncio.wait_for(
+            asyncio.gather(send(), reader.readexactly(size)), timeout=30.0
+        )
+        assert hashlib.blake2b(response).digest() == hashlib.blake2b(payload).digest()
+
+        writer.close()
+        await writer.wait_closed()
+
+    finally:
+        await server.stop()
+        server_task.cancel()
+        try:
+            await server_task
+        except asyncio.CancelledError:
+            pass
@@ -0,0 +1,267 @@
+"""Tests for the server manager and configuration hot reload."""
+
+import asyncio
+import os
+import socket
+import sys
+import tempfile
+import types
+import pytest
+import aiohttp
+from config import Config, ServerConfig
+from main import ServerManager, get_uvloop_factory
+from servers.echo_server import EchoServer
+from servers.web_server import WebServer
+
+
+def _free_port() -> int:
+    """Find a port that is currently free on 127.0.0.1."""
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def _echo(port: int, bind_address: str = '127.0.0.1') -> ServerConfig:
+    return ServerConfig(type='echo', port=port, bind_address=bind_address)
+
+
+def _web(port: int, content: str, bind_address: str = '127.0.0.1') -> ServerConfig:
+    return ServerConfig(type='web', port=port, content=content, bind_address=bind_address)
+
+
+async def _start(manager: ServerManager) -> asyncio.Task:
+    """Run start_all in the background and wait until every server listens."""
+    manager.create_servers()
+    task = asyncio.create_task(manager.start_all())
+    await asyncio.wait_for(
+        asyncio.gather(*(server.wait_ready() for server in manager.servers)), timeout=2.0
+    )
+    return task
+
+
+async def _stop(manager: ServerManager, task: asyncio.Task) -> None:
+    """Shut down a manager started with _start."""
+    await manager.stop_all()
+    await asyncio.gather(task, return_exceptions=True)
+
+
+async def _get(port: int) -> str:
+    async with aiohttp.ClientSession() as session:
+        async with session.get(f'http://127.0.0.1:{port}/') as response:
+            return await response.text()
+
+
+async def _echo_roundtrip(port: int, data: bytes = b'ping') -> bytes:
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    try:
+        writer.write(data)
+        await writer.drain()
+        return await reader.readexactly(len(data))
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_apply_config_updates_web_content():
+    """Test that changed web content is applied to the running server."""
+    manager = ServerManager(Config(servers=[_web(0, "Before")]))
+    task = await _start(manager)
+
+    try:
+        server = manager.servers[0]
+        await manager.apply_config(Config(servers=[_web(0, "After")]))
+
+        assert manager.servers == [server]
+        assert await _get(server.bound_port) == "After"
+
+    finally:
+        await _stop(manager, task)
+
+
+@pytest.mark.asyncio
+async def test_apply_config_replaces_server_type():
+    """Test swapping an echo server for a web server on the same port."""
+    port = _free_port()
+    manager = ServerManager(Config(servers=[_echo(port)]))
+    task = await _start(manager)
+
+    try:
+        assert await _echo_roundtrip(port) == b'ping'
+
+        await manager.apply_config(Config(servers=[_web(port, "Now a web server")]))
+
+        assert len(manager.servers) == 1
+        assert isinstance(manager.servers[0], WebServer)
+        assert await _get(port) == "Now a web server"
+
+    finally:
+        await _stop(manager, task)
+
+
+@pytest.mark.asyncio
+async def test_apply_config_adds_and_removes_servers():
+    """Test starting added servers and stopping removed ones."""
+    manager = ServerManager(Config(servers=[_echo(0), _web(0, "Kept")]))
+    task = await _start(manager)
+
+    try:
+        echo, web = manager.servers
+        added_port = _free_port()
+        await manager.apply_config(Config(servers=[_web(0, "Kept"), _echo(added_port)]))
+
+        assert not echo.is_running()
+        assert manager.servers[0] is web
+        assert isinstance(manager.servers[1], EchoServer)
+        assert await _echo_roundtrip(added_port) == b'ping'
+        assert await _get(web.bound_port) == "Kept"
+
+    finally:
+        await _stop(manager, task)
+
+
+@pytest.mark.asyncio
+async def test_apply_config_rebinds_server():
+    """Test that a changed bind address restarts the server."""
+    port = _free_port()
+    manager = ServerManager(Config(servers=[_web(port, "Hello")]))
+    task = await _start(manager)
+
+    try:
+        old = manager.servers[0]
+        await manager.apply_config(Config(servers=[_web(port, "Hello", bind_address='0.0.0.0')]))
+
+        new = manager.servers[0]
+        assert new is not old
+        assert new.bind_address == '0.0.0.0'
+        assert not old.is_running()
+        assert await _get(port) == "Hello"
+
+    finally:
+        await _stop(manager, task)
+
+
+@pytest.mark.asyncio
+async def test_apply_config_retries_failed_start():
+    """Test that a server whose port was busy is started on a later reload."""
+    manager = ServerManager(Config(servers=[_echo(0)]))
+    task = await _start(manager)
+
+    blocker = socket.socket()
+    blocker.bind(('127.0.0.1', 0))
+    blocker.listen()
+    port = blocker.getsockname()[1]
+
+    try:
+        await manager.apply_config(Config(servers=[_echo(0), _echo(port)]))
+        assert len(manager.servers) == 1
+
+        blocker.close()
+        await manager.apply_config(Config(servers=[_echo(0), _echo(port)]))
+        assert len(manager.servers) == 2
+        assert await _echo_roundtrip(port) == b'ping'
+
+    finally:
+        blocker.close()
+        await _stop(manager, task)
+
+
+@pytest.mark.asyncio
+async def test_apply_config_retries_server_that_failed_at_startup():
+    """Test that a server that could not bind at startup is started on reload."""
+    blocker = socket.socket()
+    blocker.bind(('127.0.0.1', 0))
+    blocker.listen()
+    port = blocker.getsockname()[1]
+
+    manager = ServerManager(Config(servers=[_echo(0), _web(port, "Before")]))
+    manager.create_servers()
+    echo, web = manager.servers
+    task = asyncio.create_task(manager.start_all())
+
+    try:
+        await asyncio.wait_for(echo.wait_ready(), timeout=2.0)
+        await asyncio.wait_for(
+            asyncio.gather(manager._server_tasks[web], return_exceptions=True), timeout=2.0
+        )
+        assert not web.is_running()
+
+        blocker.close()
+        await manager.apply_config(Config(servers=[_echo(0), _web(port, "After")]))
+
+        assert len(manager.servers) == 2
+        assert manager.servers[1] is not web
+        assert await _get(port) == "After"
+
+    finally:
+        blocker.close()
+        await _stop(manager, task)
+
+
+@pytest.mark.asyncio
+async def test_apply_config_does_not_accumulate_tasks():
+    """Test that tasks of stopped servers are dropped."""
+    port = _free_port()
+    manager = ServerManager(Config(servers=[_echo(port)]))
+    task = await _start(manager)
+
+    try:
+        for i in range(3):
+            await manager.apply_config(Config(servers=[_web(port, f"Version {i}")]))
+            await manager.apply_config(Config(servers=[_echo(port)]))
+
+        assert len(manager.servers) == 1
+        assert len(manager.tasks) == 1
+
+    finally:
+        await _stop(manager, task)
+
+
+@pytest.mark.asyncio
+async def test_watch_applies_file_changes():
+    """Test that watch() picks up edits to the configuration file."""
+    port = _free_port()
+    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
+        temp_path = f.name
+
+    Config(servers=[_web(port, "Before")]).save(temp_path)
+    manager = ServerManager(Config.load(temp_path))
+    task = await _start(manager)
+    watcher = asyncio.create_task(manager.watch(temp_path, interval=0.05))
+
+    try:
+        Config(servers=[_web(port, "After the edit")]).save(temp_path)
+
+        async def wait_for_reload():
+            while manager.servers[0].content != "After the edit":
+                await asyncio.sleep(0.05)
+
+        await asyncio.wait_for(wait_for_reload(), timeout=2.0)
+        assert await _get(port) == "After the edit"
+
+    finally:
+        watcher.cancel()
+        await asyncio.gather(watcher, return_exceptions=True)
+        await _stop(manager, task)
+        Config.invalidate_cache()
+        os.remove(temp_path)
+
+
+def test_uvloop_factory_disabled_by_env(monkeypatch):
+    """Test that SIMPLETCP_UVLOOP=0 keeps the default event loop."""
+    fake_uvloop = types.SimpleNamespace(new_event_loop=asyncio.new_event_loop)
+    monkeypatch.setitem(sys.modules, 'uvloop', fake_uvloop)
+
+    monkeypatch.setenv('SIMPLETCP_UVLOOP', '0')
+    assert get_uvloop_factory() is None
+
+    monkeypatch.delenv('SIMPLETCP_UVLOOP')
+    assert get_uvloop_factory() is fake_uvloop.new_event_loop
+
+
+def test_uvloop_factory_missing_uvloop(monkeypatch):
+    """Test that a missing uvloop falls back to the default event loop."""
+    monkeypatch.delenv('SIMPLETCP_UVLOOP', raising=False)
+    # A None entry makes "import uvloop" raise ImportError
+    monkeypatch.setitem(sys.modules, 'uvloop', None)
+    assert get_uvloop_factory() is None
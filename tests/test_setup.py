@@ -0,0 +1,49 @@
+"""Tests for the setup script."""
+
+import pytest
+from config import ServerConfig
+from setup import parse_server_specs
+
+
+def test_parse_server_specs_multiple_entries():
+    """Test comma-separated entries and repeated --servers values."""
+    servers = parse_server_specs(['echo:8000, ECHO:8001', 'echo:8002'])
+
+    assert servers == [
+        ServerConfig(type='echo', port=8000),
+        ServerConfig(type='echo', port=8001),
+        ServerConfig(type='echo', port=8002)
+    ]
+
+
+def test_parse_server_specs_default_web_page():
+    """Test that a web entry without a file gets the default page."""
+    servers = parse_server_specs(['web:8080'])
+
+    assert len(servers) == 1
+    assert servers[0].type == 'web'
+    assert servers[0].port == 8080
+    assert servers[0].content.startswith('<!DOCTYPE html>')
+    assert 'port 8080' in servers[0].content
+
+
+def test_parse_server_specs_content_file(tmp_path):
+    """Test reading web content from a file whose path contains ':'."""
+    content_file = tmp_path / 'page:v1.html'
+    content_file.write_text('<p>Hello</p>')
+
+    servers = parse_server_specs([f'web:8080:{content_file}'])
+
+    assert servers[0].content == '<p>Hello</p>'
+
+
+def test_parse_server_specs_invalid():
+    """Test rejection of malformed entries."""
+    with pytest.raises(ValueError, match="Invalid port 'abc'"):
+        parse_server_specs(['echo:abc'])
+
+    with pytest.raises(ValueError, match="Expected type:port"):
+        parse_server_specs(['echo'])
+
+    with pytest.raises(FileNotFoundError):
+        parse_server_specs(['web:8080:/nonexistent/page.html'])
@@ -1,83 +1,186 @@
 """Tests for web server."""
 
 import asyncio
+import os
 import pytest
+import pytest_asyncio
 import aiohttp
-from servers.web_server import WebServer
+from servers.web_server import SENDFILE_THRESHOLD, SharedWebApp, WebServer
 
+# Share one event loop across the module so servers and the client
+# session can be set up once and reused by every test
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
-@pytest.mark.asyncio
-async def test_web_server_basic():
-    """Test basic web server functionality."""
-    test_content = "Hello, World!"
-    server = WebServer(port=9997, content=test_content, bind_address='127.0.0.1')
 
-    server_task = asyncio.create_task(server.start())
-    await asyncio.sleep(0.5)
+async def _start(server: WebServer) -> asyncio.Task:
+    """Start a server in the background and wait until it is listening."""
+    task = asyncio.create_task(server.start())
+    await asyncio.wait_for(server.wait_ready(), timeout=2.0)
+    return task
+
 
+async def _stop(server: WebServer, task: asyncio.Task) -> None:
+    """Stop a server started with _start."""
+    await server.stop()
+    task.cancel()
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get('http://127.0.0.1:9997/') as response:
-                assert response.status == 200
-                text = await response.text()
-                assert text == test_content
+        await task
+    except asyncio.CancelledError:
+        pass
 
-    finally:
-        await server.stop()
-        server_task.cancel()
-        try:
-            await server_task
-        except asyncio.CancelledError:
-            pass
+
+@pytest_asyncio.fixture(loop_scope="module", scope="module")
+async def session():
+    """HTTP client session shared by all tests in this module."""
+    async with aiohttp.ClientSession() as session:
+        yield session
+
+
+@pytest_asyncio.fixture(loop_scope="module", scope="module")
+async def web_server():
+    """Plain-text web server shared by tests that only read from it."""
+    server = WebServer(port=0, content="Test", bind_address='127.0.0.1')
+    task = await _start(server)
+    yield server
+    await _stop(server, task)
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def make_server():
+    """Factory for per-test web servers with custom content."""
+    started = []
+
+    async def make(content: str) -> WebServer:
+        server = WebServer(port=0, content=content, bind_address='127.0.0.1')
+        started.append((server, await _start(server)))
+        return server
+
+    yield make
+
+    for server, task in started:
+        await _stop(server, task)
+
+
+async def test_web_server_basic(web_server, session):
+    """Test basic web server functionality."""
+    async with session.get(f'http://127.0.0.1:{web_server.bound_port}/') as response:
+        assert response.status == 200
+        assert response.content_type == 'text/plain'
+        assert response.headers['X-Served-Port'] == str(web_server.bound_port)
+        text = await response.text()
+        assert text == "Test"
 
 
-@pytest.mark.asyncio
-async def test_web_server_html_content():
+async def test_web_server_html_content(make_server, session):
     """Test web server with HTML content."""
     html_content = "<!DOCTYPE html><html><body>Test</body></html>"
-    server = WebServer(port=9996, content=html_content, bind_address='127.0.0.1')
+    server = await make_server(html_content)
 
-    server_task = asyncio.create_task(server.start())
-    await asyncio.sleep(0.5)
+    async with session.get(f'http://127.0.0.1:{server.bound_port}/test') as response:
+        assert response.status == 200
+        assert response.content_type.startswith('text/html')
+        text = await response.text()
+        assert text == html_content
 
-    try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get('http://127.0.0.1:9996/test') as response:
-                assert response.status == 200
-                assert response.content_type.startswith('text/html')
-                text = await response.text()
-                assert text == html_content
 
-    finally:
-        await server.stop()
-        server_task.cancel()
-        try:
-            await server_task
-        except asyncio.CancelledError:
-            pass
+async def test_web_server_multiple_requests(web_server, session):
+    """Test web server with multiple concurrent requests."""
+    async def fetch(i: int) -> None:
+        async with session.get(f'http://127.0.0.1:{web_server.bound_port}/path{i}') as response:
+            assert response.status == 200
+            text = await response.text()
+            assert text == "Test"
+
+    await asyncio.gather(*(fetch(i) for i in range(5)))
+
+
+async def test_web_server_large_content(make_server, session):
+    """Test web server serving content large enough to use sendfile."""
+    large_content = "x" * (SENDFILE_THRESHOLD * 2)
+    server = await make_server(large_content)
+
+    body_path = server._body_path
+    assert body_path is not None
+
+    async with session.get(f'http://127.0.0.1:{server.bound_port}/') as response:
+        assert response.status == 200
+        assert response.content_type == 'text/plain'
+        text = await response.text()
+        assert text == large_content
 
+    await server.stop()
+    assert not os.path.exists(body_path)
 
-@pytest.mark.asyncio
-async def test_web_server_multiple_requests():
-    """Test web server with multiple requests."""
-    server = WebServer(port=9995, content="Test", bind_address='127.0.0.1')
 
-    server_task = asyncio.create_task(server.start())
-    await asyncio.sleep(0.5)
+async def test_web_server_shared_app(session):
+    """Test several web servers sharing one application."""
+    shared = SharedWebApp()
+    servers = [
+        WebServer(port=0, content="First", bind_address='127.0.0.1', shared=shared),
+        WebServer(port=0, content="Second", bind_address='127.0.0.1', shared=shared)
+    ]
+
+    server_tasks = [asyncio.create_task(server.start()) for server in servers]
+    await asyncio.wait_for(
+        asyncio.gather(*(server.wait_ready() for server in servers)), timeout=2.0
+    )
 
     try:
-        async with aiohttp.ClientSession() as session:
-            # Make multiple requests
-            for i in range(5):
-                async with session.get(f'http://127.0.0.1:9995/path{i}') as response:
-                    assert response.status == 200
-                    text = await response.text()
-                    assert text == "Test"
+        assert servers[0].runner is servers[1].runner
+
+        async with session.get(f'http://127.0.0.1:{servers[0].bound_port}/') as response:
+            assert await response.text() == "First"
+        async with session.get(f'http://127.0.0.1:{servers[1].bound_port}/') as response:
+            assert await response.text() == "Second"
+
+        # Stopping one server leaves the other serving
+        await servers[0].stop()
+        async with session.get(f'http://127.0.0.1:{servers[1].bound_port}/') as response:
+            assert await response.text() == "Second"
 
     finally:
-        await server.stop()
-        server_task.cancel()
-        try:
-            await server_task
-        except asyncio.CancelledError:
-            pass
+        for server in servers:
+            await server.stop()
+        await shared.cleanup()
+        for task in server_tasks:
+            task.cancel()
+        await asyncio.gather(*server_tasks, return_exceptions=True)
+
+
+async def test_web_server_set_content(make_server, session):
+    """Test replacing content on a running web server."""
+    server = await make_server("Before")
+    server.set_content("<html><body>After</body></html>")
+
+    async with session.get(f'http://127.0.0.1:{server.bound_port}/') as response:
+        assert response.content_type == 'text/html'
+        assert await response.text() == "<html><body>After</body></html>"
+
+
+async def test_web_server_set_content_during_requests(make_server, session):
+    """Test that large content swapped mid-request is never missing."""
+    bodies = ["a" * (SENDFILE_THRESHOLD * 2), "b" * (SENDFILE_THRESHOLD * 2)]
+    server = await make_server(bodies[0])
+    done = False
+
+    async def swap_content():
+        i = 0
+        while not done:
+            i += 1
+            server.set_content(bodies[i % 2])
+            await asyncio.sleep(0)
+
+    async def fetch():
+        async with session.get(f'http://127.0.0.1:{server.bound_port}/') as response:
+            return response.status, await response.text()
+
+    swapper = asyncio.create_task(swap_content())
+    try:
+        results = await asyncio.gather(*(fetch() for _ in range(200)))
+    finally:
+        done = True
+        await swapper
+
+    for status, text in results:
+        assert status == 200
+        assert text in bodies